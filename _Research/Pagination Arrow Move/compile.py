@@ -1,6 +1,172 @@
+import collections
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-def compile_directory_contents(root_dir, output_file_path, readable_extensions=None):
+# Chunk size used when streaming file contents into the compilation
+READ_CHUNK_SIZE = 1 << 16
+
+# Only files up to this size are read ahead on the thread pool; larger ones are
+# streamed in chunks so they are never held in memory whole
+PREFETCH_MAX_SIZE = 4 * READ_CHUNK_SIZE
+
+# Files larger than this are listed but their contents are left out
+MAX_FILE_SIZE = 8 * 1024 * 1024
+
+# Version control, dependency and build directories that are never worth compiling
+SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'venv',
+                       '.mypy_cache', '.pytest_cache', 'dist', 'build', '.tox'})
+
+def iter_directory_tree(root_dir, skip_dirs=frozenset()):
+    """
+    Walks a directory tree top-down using os.scandir, in the same order as os.walk.
+
+    Args:
+        root_dir (str): The path to the directory to walk.
+        skip_dirs (frozenset, optional): Names of subdirectories to leave out
+            entirely. Hidden subdirectories (starting with '.') are always left out.
+
+    Yields:
+        tuple: A (dirpath, depth, file_entries) triple for each directory, where
+            depth is 0 for root_dir itself and file_entries is a list of
+            os.DirEntry objects for its files.
+    """
+    stack = [(root_dir, 0)]
+    while stack:
+        dirpath, depth = stack.pop()
+        subdirs = []
+        file_entries = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    # DirEntry answers these from the directory listing, so no
+                    # extra stat call is needed on most platforms
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # Prune skipped directories before they are ever listed
+                        if entry.name in skip_dirs or entry.name.startswith('.'):
+                            continue
+                        # Like os.walk, don't descend into symlinked directories
+                        if not entry.is_symlink():
+                            subdirs.append((entry.path, depth + 1))
+                    else:
+                        file_entries.append(entry)
+        except OSError:
+            # Unreadable subdirectories are skipped, as os.walk does
+            if dirpath is root_dir:
+                raise
+            continue
+
+        yield dirpath, depth, file_entries
+        # Push in reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+def is_same_file(file_path, file_stat):
+    """
+    Checks whether a path refers to the file described by a stat result.
+
+    Args:
+        file_path (str): The path to check.
+        file_stat (os.stat_result): The stat result of the file to compare with.
+
+    Returns:
+        bool: True if file_path resolves to the same file, False otherwise or
+            if it cannot be stat'ed.
+    """
+    try:
+        return os.path.samestat(os.stat(file_path), file_stat)
+    except OSError:
+        return False
+
+def read_file_bytes(file_path):
+    """
+    Reads the raw contents of a file.
+
+    Args:
+        file_path (str): The path to the file to read.
+
+    Returns:
+        bytes: The file's contents.
+    """
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+def copy_file_contents(file_path, outfile):
+    """
+    Streams a file's raw bytes into an open output file in fixed-size chunks.
+
+    Only failures opening or reading file_path are caught; errors writing to
+    outfile propagate to the caller.
+
+    Args:
+        file_path (str): The path to the file to copy.
+        outfile (file): The binary file object to write to.
+
+    Returns:
+        OSError: The error raised while opening or reading file_path, or None
+            if the whole file was copied.
+    """
+    try:
+        source = open(file_path, 'rb')
+    except OSError as e:
+        return e
+    with source:
+        while True:
+            try:
+                chunk = source.read(READ_CHUNK_SIZE)
+            except OSError as e:
+                return e
+            if not chunk:
+                return None
+            outfile.write(chunk)
+
+def iter_prefetched_reads(files, max_workers, prefetch_limit):
+    """
+    Pairs each small file with a read of its contents running on a thread pool.
+
+    At most max_workers reads are in flight or waiting to be consumed at any
+    time, and only files up to prefetch_limit bytes are read ahead, so memory
+    held by prefetched contents stays under max_workers * prefetch_limit.
+
+    Args:
+        files (list): (file_path, size) pairs for the files to read, in output order.
+        max_workers (int): The number of reader threads. With 1 or fewer, no
+            pool is used and None is paired with each file instead.
+        prefetch_limit (int): Files larger than this are paired with None and
+            left for the caller to stream.
+
+    Yields:
+        tuple: A (file_path, size, future) triple in the order of files, where
+            the future resolves to the file's bytes.
+    """
+    if max_workers <= 1:
+        for file_path, size in files:
+            yield file_path, size, None
+        return
+
+    pending = collections.deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for file_path, size in files:
+                future = None
+                if size <= prefetch_limit:
+                    future = executor.submit(read_file_bytes, file_path)
+                pending.append((file_path, size, future))
+                if len(pending) >= max_workers:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+        finally:
+            # Don't let queued reads run if the consumer stopped early
+            for _, _, future in pending:
+                if future is not None:
+                    future.cancel()
+
+def compile_directory_contents(root_dir, output_file_path, readable_extensions=None,
+                               max_workers=None, skip_dirs=None, max_file_size=None):
     """
     Compiles a directory's file structure and the contents of specified file types
     into a single text file.
@@ -10,63 +176,98 @@ def compile_directory_contents(root_dir, output_file_path, readable_extensions=N
         output_file_path (str): The path to the output text file.
         readable_extensions (list, optional): A list of file extensions to read.
             Defaults to a common list of text-based files.
+        max_workers (int, optional): The number of threads used to read small
+            files ahead of writing them, which helps on network filesystems.
+            Larger files are always streamed. Set to 1 to stream every file
+            serially. Defaults to min(32, 4 * CPU count).
+        skip_dirs (list, optional): Names of directories to leave out of the
+            compilation, along with all hidden directories. Defaults to SKIP_DIRS.
+        max_file_size (int, optional): The size in bytes above which a file's
+            contents are skipped. Empty files are always left out of the
+            contents section. Defaults to MAX_FILE_SIZE.
     """
     # Default list of extensions for files that can be read by a text editor
     if readable_extensions is None:
         readable_extensions = ['.txt', '.js', '.html', '.css', '.py', '.json',
                                '.md', '.log', '.xml', '.yml', '.yaml', '.sh']
 
-    # Normalize extensions to be lowercase for consistent checking
-    readable_extensions = [ext.lower() for ext in readable_extensions]
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    skip_dirs = SKIP_DIRS if skip_dirs is None else frozenset(skip_dirs)
+
+    if max_file_size is None:
+        max_file_size = MAX_FILE_SIZE
 
-    # Initialize an empty list to store the output lines
-    output_lines = []
-    output_lines.append(f"## Directory Compilation for: {os.path.abspath(root_dir)}\n\n")
+    # Normalize extensions to be lowercase without the leading dot, and keep
+    # them in a set for fast lookups
+    readable_extensions = frozenset(ext.lstrip('.').lower() for ext in readable_extensions)
 
+    # The heading and tree are collected in memory while a single walk also
+    # gathers the list of readable files whose contents follow them
+    tree_buf = io.StringIO()
+    tree_buf.write(f"## Directory Compilation for: {os.path.abspath(root_dir)}\n\n")
+    file_list = []
+
+    # Indentation strings indexed by level, grown as deeper levels are reached
+    indent_cache = ['']
+
+    # A previous compilation inside root_dir must not be read back into itself.
+    # It is matched by file identity, since the tree may spell its path
+    # differently (symlinked root, hardlink, case-insensitive filesystem)
     try:
-        # Use os.walk to traverse the directory tree
-        for dirpath, dirnames, filenames in os.walk(root_dir):
-            # Calculate the relative path for a clean tree structure
-            relative_path = os.path.relpath(dirpath, root_dir)
+        output_stat = os.stat(output_file_path)
+    except OSError:
+        output_stat = None
 
-            # Ignore the root directory itself in the tree view if it's the current directory
-            if relative_path == ".":
-                relative_path = ""
+    try:
+        # Traverse the directory tree with os.scandir
+        for dirpath, depth, file_entries in iter_directory_tree(root_dir, skip_dirs):
+            # The root directory and its direct children share the top indent level
+            indent_level = max(depth - 1, 0)
+            while len(indent_cache) <= indent_level + 1:
+                indent_cache.append(indent_cache[-1] + '  ')
 
-            # Add directory path to the output with indentation
-            indent_level = len(relative_path.split(os.sep)) - 1
-            if relative_path:
-                output_lines.append(f"{'  ' * indent_level}├── {os.path.basename(dirpath)}{os.sep}\n")
+            # Add directory path to the output with indentation,
+            # ignoring the root directory itself in the tree view
+            if depth:
+                tree_buf.write(f"{indent_cache[indent_level]}├── {os.path.basename(dirpath)}{os.sep}\n")
+
+            # List and read files in inode order, which tends to follow their
+            # on-disk layout; DirEntry.inode() is free on POSIX but needs a stat
+            # call on Windows
+            if os.name == 'posix':
+                file_entries.sort(key=os.DirEntry.inode)
 
             # Add files to the output with indentation
-            for filename in filenames:
-                output_lines.append(f"{'  ' * (indent_level + 1)}├── {filename}\n")
-
-            # Add a separator between the file tree and file contents
-            if not output_lines[-1].endswith('\n'):
-                output_lines.append('\n')
-
-        output_lines.append("\n" + "="*80 + "\n\n")
-        output_lines.append("## File Contents\n\n")
-
-        # Now, iterate through the directory again to read file contents
-        for dirpath, _, filenames in os.walk(root_dir):
-            for filename in filenames:
-                file_path = os.path.join(dirpath, filename)
-                file_extension = os.path.splitext(filename)[1].lower()
-
-                # Check if the file's extension is in our list of readable types
-                if file_extension in readable_extensions:
-                    output_lines.append(f"### File: {file_path}\n")
-                    output_lines.append("-" * (len(f"### File: {file_path}") - 1) + "\n")
+            file_indent = indent_cache[indent_level + 1]
+            for entry in file_entries:
+                tree_buf.write(f"{file_indent}├── {entry.name}\n")
+
+                # Remember files with a readable extension for the contents section
+                # Like os.path.splitext, a name made of leading dots and an
+                # extension-like part (e.g. '.bashrc') has no extension
+                stem, dot, file_extension = entry.name.rpartition('.')
+                if dot and stem.lstrip('.') and file_extension.lower() in readable_extensions:
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            # Read and add the file's content to the output
-                            content = f.read()
-                            output_lines.append(content)
-                            output_lines.append("\n\n") # Add a newline for separation
-                    except (IOError, UnicodeDecodeError) as e:
-                        output_lines.append(f"[ERROR] Could not read file: {e}\n\n")
+                        size = entry.stat().st_size
+                    except OSError:
+                        # Leave it to the read to report the problem
+                        size = 0
+                    else:
+                        # Empty files have no contents to show
+                        if size == 0:
+                            continue
+                        # DirEntry.stat() leaves st_ino and st_dev unset on
+                        # Windows, so files as large as the output are
+                        # confirmed with a full stat
+                        if (output_stat is not None and size == output_stat.st_size
+                                and is_same_file(entry.path, output_stat)):
+                            continue
+                    file_list.append((entry.path, size))
+
+        tree_buf.write("\n" + "="*80 + "\n\n")
+        tree_buf.write("## File Contents\n\n")
 
     except FileNotFoundError:
         print(f"Error: The directory '{root_dir}' was not found.")
@@ -75,10 +276,43 @@ def compile_directory_contents(root_dir, output_file_path, readable_extensions=N
         print(f"An unexpected error occurred: {e}")
         return
 
-    # Write the collected output to the specified file
+    # Stream the output straight to disk so that memory use is bounded by the
+    # tree listing rather than by the size of everything being compiled
     try:
-        with open(output_file_path, 'w', encoding='utf-8') as outfile:
-            outfile.writelines(output_lines)
+        with open(output_file_path, 'wb', buffering=1 << 20) as outfile:
+            outfile.write(tree_buf.getvalue().encode('utf-8'))
+            output_stat = os.fstat(outfile.fileno())
+
+            # Now, add the contents of every readable file found during the walk
+            for file_path, size, pending_read in iter_prefetched_reads(
+                    file_list, max_workers, min(PREFETCH_MAX_SIZE, max_file_size)):
+                # Entries whose size couldn't be read during the walk may only
+                # now resolve to the new output, e.g. through a dangling symlink
+                if size == 0 and is_same_file(file_path, output_stat):
+                    continue
+                header = f"### File: {file_path}"
+                outfile.write(header.encode('utf-8') + b"\n")
+                outfile.write(b"-" * (len(header) - 1) + b"\n")
+                if size > max_file_size:
+                    outfile.write(f"[SKIPPED: {size} bytes]\n\n".encode('utf-8'))
+                    continue
+                # Only input failures are reported inline; errors writing the
+                # output go to the handler below
+                if pending_read is None:
+                    read_error = copy_file_contents(file_path, outfile)
+                else:
+                    try:
+                        content = pending_read.result()
+                    except IOError as e:
+                        read_error = e
+                    else:
+                        read_error = None
+                        outfile.write(content)
+
+                if read_error is None:
+                    outfile.write(b"\n\n") # Add a newline for separation
+                else:
+                    outfile.write(f"[ERROR] Could not read file: {read_error}\n\n".encode('utf-8'))
         print(f"Successfully compiled contents to '{output_file_path}'")
     except IOError as e:
         print(f"Error: Could not write to the output file '{output_file_path}': {e}")
@@ -60,12 +60,14 @@ def compile_directory_contents(root_dir, output_file_path, readable_extensions=N
                     output_lines.append(f"### File: {file_path}\n")
                     output_lines.append("-" * (len(f"### File: {file_path}") - 1) + "\n")
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
+                        # Undecodable bytes are carried through as surrogates
+                        # rather than failing the whole file
+                        with open(file_path, 'r', encoding='utf-8', errors='surrogateescape') as f:
                             # Read and add the file's content to the output
                             content = f.read()
                             output_lines.append(content)
                             output_lines.append("\n\n") # Add a newline for separation
-                    except (IOError, UnicodeDecodeError) as e:
+                    except IOError as e:
                         output_lines.append(f"[ERROR] Could not read file: {e}\n\n")
 
     except FileNotFoundError:
@@ -77,7 +79,7 @@ def compile_directory_contents(root_dir, output_file_path, readable_extensions=N
 
     # Write the collected output to the specified file
     try:
-        with open(output_file_path, 'w', encoding='utf-8') as outfile:
+        with open(output_file_path, 'w', encoding='utf-8', errors='surrogateescape') as outfile:
             outfile.writelines(output_lines)
         print(f"Successfully compiled contents to '{output_file_path}'")
     except IOError as e: